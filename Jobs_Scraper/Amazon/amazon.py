@@ -24,7 +24,7 @@ def load_existing_links():
 
     for file in files:
         try:
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, usecols=lambda column: column in ("link", "url"))
             for column in ("link", "url"):
                 if column in df.columns:
                     existing_links.update(df[column].dropna().astype(str).tolist())
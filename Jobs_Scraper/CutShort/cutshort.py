@@ -7,6 +7,10 @@ import pandas as pd
 from playwright.sync_api import sync_playwright
 
 URL = "https://cutshort.io/jobs"
+# Read every job link's href and text in one round-trip to the browser.
+LINKS_JS = "els => els.map(el => ({ href: el.getAttribute('href'), text: el.innerText }))"
+
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
 
 
 def load_existing_links():
@@ -15,7 +19,7 @@ def load_existing_links():
 
     for file in files:
         try:
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, usecols=lambda column: column in ("link", "url"))
             for column in ("link", "url"):
                 if column in df.columns:
                     existing_links.update(df[column].dropna().astype(str).tolist())
@@ -88,20 +92,35 @@ def fetch_jobs(existing_links):
     with sync_playwright() as playwright:
         browser = playwright.chromium.launch(headless=True)
         page = browser.new_page()
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+            else route.continue_(),
+        )
 
         print("Opening Cutshort jobs page...")
         page.goto(URL, timeout=60000)
-        page.wait_for_timeout(5000)
+        try:
+            page.wait_for_selector("a[href*='/job/']", timeout=15000)
+        except Exception:
+            pass
 
+        # Stop scrolling as soon as a scroll no longer loads more jobs.
+        previous_height = 0
         for _ in range(5):
-            page.mouse.wheel(0, 5000)
+            height = page.evaluate("document.body.scrollHeight")
+            if height == previous_height:
+                break
+            previous_height = height
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             page.wait_for_timeout(2000)
 
-        links = page.query_selector_all("a")
+        links = page.eval_on_selector_all("a[href*='/job/']", LINKS_JS)
 
         for link in links:
-            href = link.get_attribute("href")
-            if not href or "/job/" not in href:
+            href = link["href"]
+            if not href:
                 continue
 
             full_link = "https://cutshort.io" + href
@@ -109,7 +128,7 @@ def fetch_jobs(existing_links):
                 continue
 
             try:
-                title = link.inner_text().split("\n")[0].strip()
+                title = (link["text"] or "").split("\n")[0].strip()
                 jobs.append(
                     {
                         "title": title,
@@ -24,7 +24,7 @@ HEADERS = {
 
 
 # ===== DATA MODEL =====
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     job_id: str
     title: Optional[str]
@@ -35,6 +35,9 @@ class JobRecord:
     description: Optional[str]
     source_page: int
 
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 # ===== LOAD OLD JOBS =====
 def load_existing_ids():
@@ -242,7 +245,7 @@ def main():
 
     jobs = scrape_jobs()
     if jobs:
-        normalized_jobs = [normalize_job(asdict(job)) for job in jobs]
+        normalized_jobs = [normalize_job(job) for job in jobs]
         save_jobs_unified(normalized_jobs)
     else:
         print("No new jobs found")
@@ -23,7 +23,7 @@ HEADERS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     job_id: str
     title: Optional[str]
@@ -34,6 +34,9 @@ class JobRecord:
     description: Optional[str]
     source_page: int
 
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 def load_existing_ids():
 
@@ -253,7 +256,7 @@ def main():
 
     jobs = scrape_jobs()
     if jobs:
-        normalized_jobs = [normalize_job(asdict(job)) for job in jobs]
+        normalized_jobs = [normalize_job(job) for job in jobs]
         save_jobs_unified(normalized_jobs)
     else:
         print("No new jobs found")
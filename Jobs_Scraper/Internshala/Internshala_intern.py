@@ -22,7 +22,7 @@ def load_existing_links():
 
     for file in files:
         try:
-            df = pd.read_csv(file)
+            df = pd.read_csv(file, usecols=lambda column: column == "link")
             if "link" in df.columns:
                 existing_links.update(df["link"].dropna().tolist())
         except:
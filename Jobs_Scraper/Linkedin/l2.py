@@ -1,30 +1,61 @@
+import concurrent.futures as cf
+import csv
 import os
+import random
+import re
+import threading
 import time
 from datetime import datetime
 
-import pandas as pd
 import requests
-from bs4 import BeautifulSoup
+from bs4 import BeautifulSoup, SoupStrainer
+from requests.adapters import HTTPAdapter
 
 BASE_URL = "https://www.linkedin.com/jobs-guest/jobs/api/seeMoreJobPostings/search"
+DETAIL_URL = "https://www.linkedin.com/jobs-guest/jobs/api/jobPosting/{job_id}"
+JOB_ID_PATTERN = re.compile(r"/jobs/view/(?:[^/?]*-)?(\d+)")
+# Only the description markup is read from a detail page, so build just that subtree.
+DESCRIPTION_STRAINER = SoupStrainer(
+    "div", class_=re.compile(r"(^|\s)show-more-less-html__markup(\s|$)")
+)
 KEYWORD = "AI Engineer"
 LOCATION = "India"
 PAGES = 5
 RESULTS_PER_PAGE = 25
+SEARCH_PARAMS = {"keywords": KEYWORD, "location": LOCATION}
+DETAIL_WORKERS = 6
 
 HEADERS = {
     "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64)",
     "Accept-Language": "en-US,en;q=0.9",
 }
 
+thread_local = threading.local()
+
+
+def build_session(pool_size):
+    session = requests.Session()
+    session.headers.update(HEADERS)
+    adapter = HTTPAdapter(pool_connections=pool_size, pool_maxsize=pool_size)
+    session.mount("http://", adapter)
+    session.mount("https://", adapter)
+    return session
+
+
+def get_session():
+    # One keep-alive session per thread so the TLS handshake is paid once per
+    # worker instead of once per request.
+    if not hasattr(thread_local, "session"):
+        thread_local.session = build_session(4)
+    return thread_local.session
+
 
 def get_page(params):
     for attempt in range(5):
         try:
-            response = requests.get(
+            response = get_session().get(
                 BASE_URL,
                 params=params,
-                headers=HEADERS,
                 timeout=15,
             )
 
@@ -38,10 +69,23 @@ def get_page(params):
     return None
 
 
+def extract_job_id(url):
+    match = JOB_ID_PATTERN.search(url or "")
+    return match.group(1) if match else None
+
+
 def fetch_description(url):
+    # The guest jobPosting endpoint returns just the detail fragment, which is
+    # far lighter than the full public job page.
+    job_id = extract_job_id(url)
+    detail_url = DETAIL_URL.format(job_id=job_id) if job_id else url
+
     try:
-        response = requests.get(url, headers=HEADERS, timeout=15)
-        soup = BeautifulSoup(response.text, "html.parser")
+        session = get_session()
+        response = session.get(detail_url, timeout=15)
+        if response.status_code in (429, 451) and detail_url != url:
+            response = session.get(url, timeout=15)
+        soup = BeautifulSoup(response.text, "html.parser", parse_only=DESCRIPTION_STRAINER)
         description = soup.find("div", class_="show-more-less-html__markup")
         if description:
             return description.text.strip()
@@ -51,58 +95,75 @@ def fetch_description(url):
     return ""
 
 
-def fetch_jobs():
-    jobs = []
+def fetch_card_description(job):
+    description = fetch_description(job["link"])
+    # Per-worker jitter keeps the request cadence close to a human browsing.
+    time.sleep(random.uniform(0.5, 1.5))
+    return description
 
-    for page in range(PAGES):
-        start = page * RESULTS_PER_PAGE
-        params = {
-            "keywords": KEYWORD,
-            "location": LOCATION,
-            "start": start,
-        }
 
-        print(f"Fetching page {page + 1}...")
-        html = get_page(params)
+def fetch_search_page(page):
+    params = {**SEARCH_PARAMS, "start": page * RESULTS_PER_PAGE}
+    print(f"Fetching page {page + 1}...")
+    return get_page(params)
 
-        if html is None:
-            print("Skipping page due to connection failure")
-            continue
 
-        soup = BeautifulSoup(html, "html.parser")
-        listings = soup.find_all("li")
-
-        for job in listings:
-            try:
-                title_node = job.find("h3", class_="base-search-card__title")
-                company_node = job.find("h4", class_="base-search-card__subtitle")
-                location_node = job.find("span", class_="job-search-card__location")
-                link_node = job.find("a", class_="base-card__full-link")
+def fetch_jobs(known_ids=frozenset()):
+    jobs = []
+    seen_keys = set()
+    skipped = 0
+
+    with cf.ThreadPoolExecutor(max_workers=DETAIL_WORKERS) as pool:
+        # Search pages are independent fragments, so fetch them together and
+        # parse them in page order.
+        for html in pool.map(fetch_search_page, range(PAGES)):
+            if html is None:
+                print("Skipping page due to connection failure")
+                continue
 
-                if not (title_node and company_node and location_node and link_node):
+            soup = BeautifulSoup(html, "html.parser")
+            listings = soup.find_all("li")
+
+            for job in listings:
+                try:
+                    title_node = job.find("h3", class_="base-search-card__title")
+                    company_node = job.find("h4", class_="base-search-card__subtitle")
+                    location_node = job.find("span", class_="job-search-card__location")
+                    link_node = job.find("a", class_="base-card__full-link")
+
+                    if not (title_node and company_node and location_node and link_node):
+                        continue
+
+                    link = link_node["href"]
+                    job_key = extract_job_id(link) or link
+
+                    # Jobs saved by an earlier run are dropped in save_jobs anyway,
+                    # so don't spend a description request on them.
+                    if job_key in known_ids:
+                        skipped += 1
+                        continue
+
+                    # Search pages overlap, so the same job can show up twice.
+                    if job_key in seen_keys:
+                        continue
+                    seen_keys.add(job_key)
+
+                    jobs.append(
+                        {
+                            "title": title_node.text.strip(),
+                            "company": company_node.text.strip(),
+                            "location": location_node.text.strip(),
+                            "link": link,
+                            "description": "",
+                        }
+                    )
+                except Exception:
                     continue
 
-                title = title_node.text.strip()
-                company = company_node.text.strip()
-                location = location_node.text.strip()
-                link = link_node["href"]
-                description = fetch_description(link)
-
-                jobs.append(
-                    {
-                        "title": title,
-                        "company": company,
-                        "location": location,
-                        "link": link,
-                        "description": description,
-                    }
-                )
-
-                time.sleep(1)
-            except Exception:
-                continue
-
-        time.sleep(2)
+        print(f"Skipped {skipped} previously scraped jobs")
+        print(f"Fetching {len(jobs)} job descriptions...")
+        for job, description in zip(jobs, pool.map(fetch_card_description, jobs)):
+            job["description"] = description
 
     return jobs
 
@@ -118,16 +179,20 @@ def load_existing_links():
             continue
 
         try:
-            df = pd.read_csv(os.path.join("data", file))
-            if "link" in df.columns:
-                existing_links.update(df["link"].dropna().astype(str).tolist())
+            with open(os.path.join("data", file), newline="", encoding="utf-8") as handle:
+                for row in csv.DictReader(handle):
+                    if row.get("link"):
+                        existing_links.add(row["link"])
         except Exception:
             pass
 
     return existing_links
 
 
-def save_jobs(jobs):
+def save_jobs(jobs, existing_links):
+    # pandas is only needed once there is something to write.
+    import pandas as pd
+
     os.makedirs("data", exist_ok=True)
     timestamp = datetime.now().strftime("%Y-%m-%d_%H-%M-%S")
     filename = f"data/linkedin_jobs_{timestamp}.csv"
@@ -135,7 +200,6 @@ def save_jobs(jobs):
     df = pd.DataFrame(jobs)
     df.drop_duplicates(subset=["link"], inplace=True)
 
-    existing_links = load_existing_links()
     df = df[~df["link"].isin(existing_links)]
 
     df.to_csv(filename, index=False)
@@ -144,10 +208,15 @@ def save_jobs(jobs):
 
 def main():
     print("\nStarting LinkedIn Job Scraper...\n")
-    jobs = fetch_jobs()
+    existing_links = load_existing_links()
+    known_ids = {extract_job_id(link) for link in existing_links}
+    known_ids.discard(None)
+    print(f"Previously scraped jobs: {len(existing_links)}")
+
+    jobs = fetch_jobs(known_ids)
 
     if jobs:
-        save_jobs(jobs)
+        save_jobs(jobs, existing_links)
     else:
         print("No jobs found.")
 
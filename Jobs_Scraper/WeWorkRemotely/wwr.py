@@ -6,6 +6,11 @@ from datetime import datetime
 
 
 URL = "https://weworkremotely.com/remote-jobs"
+# Read every job link's href and text in one round-trip to the browser.
+LINKS_JS = "els => els.map(el => ({ href: el.getAttribute('href'), text: el.innerText }))"
+
+
+BLOCKED_RESOURCE_TYPES = ("image", "font", "media")
 
 
 def fetch_description(page, url):
@@ -35,25 +40,39 @@ def fetch_jobs():
 
         browser = p.chromium.launch(headless=True)
         page = browser.new_page()
+        page.route(
+            "**/*",
+            lambda route: route.abort()
+            if route.request.resource_type in BLOCKED_RESOURCE_TYPES
+            else route.continue_(),
+        )
 
         print("Opening WeWorkRemotely page...")
         page.goto(URL, timeout=60000)
 
-        page.wait_for_timeout(5000)
+        try:
+            page.wait_for_selector("a[href*='/remote-jobs/']", timeout=15000)
+        except:
+            pass
 
-        # scroll to ensure all jobs load
+        # scroll to ensure all jobs load, stopping once the page stops growing
+        previous_height = 0
         for _ in range(6):
-            page.mouse.wheel(0, 4000)
+            height = page.evaluate("document.body.scrollHeight")
+            if height == previous_height:
+                break
+            previous_height = height
+            page.evaluate("window.scrollTo(0, document.body.scrollHeight)")
             page.wait_for_timeout(1500)
 
-        job_links = page.query_selector_all("a[href*='/remote-jobs/']")
+        job_links = page.eval_on_selector_all("a[href*='/remote-jobs/']", LINKS_JS)
 
         for link in job_links:
 
             try:
 
-                href = link.get_attribute("href")
-                text = link.inner_text().split("\n")
+                href = link["href"]
+                text = (link["text"] or "").split("\n")
 
                 title = text[0] if len(text) > 0 else ""
                 company = text[1] if len(text) > 1 else ""
@@ -93,7 +112,7 @@ def load_existing_links():
 
             try:
 
-                df = pd.read_csv(os.path.join("data", file))
+                df = pd.read_csv(os.path.join("data", file), usecols=lambda column: column == "link")
 
                 if "link" in df.columns:
                     existing_links.update(df["link"].dropna().tolist())
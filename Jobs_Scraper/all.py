@@ -1,4 +1,5 @@
 import argparse
+import concurrent.futures as cf
 import glob
 import hashlib
 import json
@@ -42,6 +43,9 @@ DATA_GLOBS = {
     "weworkremotely": ["data/weworkremotely_jobs_*.csv", "WeWorkRemotely/data/*.csv"],
 }
 
+UPSERT_BATCH_SIZE = 500
+UPSERT_WORKERS = 4
+
 
 def parse_args():
     parser = argparse.ArgumentParser()
@@ -270,15 +274,15 @@ def save_snapshot(df: pd.DataFrame) -> str:
     return filename
 
 
-def save_latest_payload(payload: Dict[str, object]) -> None:
+def save_latest_payload(serialized: str) -> None:
     path = os.path.join(os.path.dirname(__file__), "latest_jobs.json")
     with open(path, "w", encoding="utf-8") as handle:
-        json.dump(payload, handle, ensure_ascii=False)
+        handle.write(serialized)
 
 
 def upsert_to_mongo(jobs: List[Dict[str, object]]) -> Dict[str, int]:
     import certifi
-    from pymongo import MongoClient, UpdateOne
+    from pymongo import ASCENDING, IndexModel, MongoClient, UpdateOne
 
     uri = (os.getenv("MONGODB_URI") or "").strip()
     if not uri:
@@ -297,13 +301,23 @@ def upsert_to_mongo(jobs: List[Dict[str, object]]) -> Dict[str, int]:
     )
     try:
         collection = client[db_name][collection_name]
-        collection.create_index("apply_url", unique=True)
-        collection.create_index("dedupe_key", sparse=True)
-        collection.create_index("created_at")
-        collection.create_index("source")
+        # One createIndexes command instead of a round-trip per index.
+        collection.create_indexes(
+            [
+                IndexModel([("apply_url", ASCENDING)], unique=True),
+                IndexModel([("dedupe_key", ASCENDING)], sparse=True),
+                IndexModel([("created_at", ASCENDING)]),
+                IndexModel([("source", ASCENDING)]),
+            ]
+        )
+
+        # Batches run concurrently, so two jobs sharing an apply_url in different
+        # batches could both take the insert path and trip the unique index. Keep
+        # the last job per apply_url, which is what a single bulk_write ended with.
+        unique_jobs = {job["apply_url"]: job for job in jobs}
 
         operations = []
-        for job in jobs:
+        for job in unique_jobs.values():
             operations.append(
                 UpdateOne(
                     {
@@ -328,12 +342,24 @@ def upsert_to_mongo(jobs: List[Dict[str, object]]) -> Dict[str, int]:
         if not operations:
             return {"inserted": 0, "matched": 0, "modified": 0}
 
-        result = collection.bulk_write(operations, ordered=False)
-        return {
-            "inserted": result.upserted_count,
-            "matched": result.matched_count,
-            "modified": result.modified_count,
-        }
+        # Batches are independent, so send them concurrently over the client's
+        # connection pool instead of waiting on each round-trip in turn.
+        batches = [
+            operations[start : start + UPSERT_BATCH_SIZE]
+            for start in range(0, len(operations), UPSERT_BATCH_SIZE)
+        ]
+        summary = {"inserted": 0, "matched": 0, "modified": 0}
+        with cf.ThreadPoolExecutor(max_workers=UPSERT_WORKERS) as pool:
+            futures = [
+                pool.submit(collection.bulk_write, batch, ordered=False)
+                for batch in batches
+            ]
+            for future in cf.as_completed(futures):
+                result = future.result()
+                summary["inserted"] += result.upserted_count
+                summary["matched"] += result.matched_count
+                summary["modified"] += result.modified_count
+        return summary
     finally:
         client.close()
 
@@ -386,8 +412,10 @@ def main():
         "scrapers": runs,
         "dry_run": args.dry_run,
     }
-    save_latest_payload(payload)
-    sys.stdout.write(json.dumps(payload))
+    # The payload carries every job, so encode it once for both outputs.
+    serialized = json.dumps(payload)
+    save_latest_payload(serialized)
+    sys.stdout.write(serialized)
 
 
 if __name__ == "__main__":
@@ -15,7 +15,6 @@ import os
 import glob
 from dataclasses import dataclass, asdict
 from typing import Any, Dict, List, Optional, Set, Tuple
-from urllib.parse import urljoin
 
 import requests
 from bs4 import BeautifulSoup
@@ -29,7 +28,7 @@ HEADERS = {
 }
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class JobRecord:
     job_url: str
     job_link: str
@@ -51,6 +50,9 @@ class JobRecord:
     description: Optional[str]
     raw_fields_json: str
 
+    def get(self, key, default=None):
+        return getattr(self, key, default)
+
 
 def clean_text(value: str) -> str:
     return re.sub(r"\s+", " ", value).strip()
@@ -61,6 +63,15 @@ def excel_hyperlink(url: str) -> str:
     return f'=HYPERLINK("{safe_url}","Open Job")'
 
 
+def absolute_url(href: str) -> str:
+    # Cheap stand-in for urljoin(BASE_URL, href) on the shapes the sitemap emits.
+    if href.startswith(("http://", "https://")):
+        return href
+    if href.startswith("//"):
+        return "https:" + href
+    return BASE_URL + (href if href.startswith("/") else "/" + href)
+
+
 def extract_links_from_listing(html: str) -> List[str]:
 
     links = set()
@@ -69,7 +80,7 @@ def extract_links_from_listing(html: str) -> List[str]:
 
         if "/j/" in href:
 
-            links.add(urljoin(BASE_URL, href.split("?")[0].rstrip("/")))
+            links.add(absolute_url(href.split("?", 1)[0].rstrip("/")))
 
     return sorted(links)
 
@@ -275,7 +286,7 @@ def main():
     records = scrape_jobs(args.pages, args.workers)
     records = [r for r in records if r.job_url not in existing_ids]
     if records:
-        normalized_jobs = [normalize_job(asdict(r)) for r in records]
+        normalized_jobs = [normalize_job(r) for r in records]
         save_csv_unified(normalized_jobs)
     else:
         print("No new jobs found")
@@ -64,7 +64,7 @@ def load_existing_links():
 
             try:
 
-                df = pd.read_csv(os.path.join("data", file))
+                df = pd.read_csv(os.path.join("data", file), usecols=lambda column: column == "link")
 
                 if "link" in df.columns:
                     existing_links.update(df["link"].dropna().tolist())
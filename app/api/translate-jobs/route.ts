@@ -1,6 +1,6 @@
 import { NextRequest, NextResponse } from "next/server";
 import { ensureJobsEnglish } from "@/lib/translate";
-import { countJobs, getJobsBatch, updateJobById } from "@/lib/jobs";
+import { countJobs, getJobsBatch, updateJobsById } from "@/lib/jobs";
 
 export async function POST(req: NextRequest) {
   try {
@@ -45,26 +45,29 @@ export async function POST(req: NextRequest) {
       })),
     );
 
-    let updated = 0;
-    for (let i = 0; i < chunk.length; i++) {
-      const orig = chunk[i];
+    // Send every changed job in one bulkWrite instead of an update (and collection setup) per job.
+    const changes = chunk.flatMap((orig, i) => {
       const t = translated[i];
       const changed =
         t.title !== (orig.title ?? "") ||
         t.company !== (orig.company ?? "") ||
         t.location !== (orig.location ?? null) ||
         (t.description ?? null) !== (orig.description ?? null);
-      if (!changed) continue;
+      if (!changed) return [];
 
-      const saved = await updateJobById(orig.id, {
-        title: t.title,
-        company: t.company,
-        location: t.location ?? orig.location ?? "Remote",
-        description: t.description ?? orig.description,
-      });
-
-      if (saved) updated++;
-    }
+      return [
+        {
+          id: orig.id,
+          updates: {
+            title: t.title,
+            company: t.company,
+            location: t.location ?? orig.location ?? "Remote",
+            description: t.description ?? orig.description,
+          },
+        },
+      ];
+    });
+    const updated = await updateJobsById(changes);
 
     return NextResponse.json({
       success: true,
@@ -383,6 +383,29 @@ export async function updateJobById(
   return result.matchedCount > 0;
 }
 
+/** Apply several updateJobById-style updates in one bulkWrite; returns how many jobs matched. */
+export async function updateJobsById(
+  updates: { id: string; updates: Partial<JobUpsertInput> }[],
+): Promise<number> {
+  const valid = updates.filter(({ id }) => ObjectId.isValid(id));
+  if (!valid.length) {
+    return 0;
+  }
+
+  const collection = await getJobsCollection();
+  const updatedAt = new Date().toISOString();
+  const result = await collection.bulkWrite(
+    valid.map(({ id, updates: fields }) => ({
+      updateOne: {
+        filter: { _id: new ObjectId(id) },
+        update: { $set: { ...fields, updated_at: updatedAt } },
+      },
+    })),
+    { ordered: false },
+  );
+  return result.matchedCount;
+}
+
 export async function deleteJobById(id: string): Promise<boolean> {
   if (!ObjectId.isValid(id)) {
     return false;
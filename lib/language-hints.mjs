@@ -0,0 +1,107 @@
+/**
+ * Word lists that mark job text as non-English even when it is plain ASCII, and name the
+ * language it is likely written in. Shared by lib/translate.ts and scripts/translate-all.mjs.
+ *
+ * Each language has whole-word function words and local place names ("Wien", "Milano"; their
+ * English names stay untranslated), job-title stems matched inside compounds
+ * ("Softwareentwickler", "Projektleiter") and, where it has them, distinctive letters. Matching
+ * is case-insensitive, so words that also occur in English job text are left out on purpose:
+ * English words and abbreviations ("die", "an", "mit"/MIT, "met", "ist"/IST, "ich"/ICH-GCP,
+ * "para", "con", "fur"), surnames and place names ("das", "des", "les", "della", "bei", "von",
+ * "los"/Los Angeles, "del"), and state and country codes such as "IL", "DE", "AUS".
+ */
+
+const LANGUAGES = [
+  {
+    lang: "de",
+    words: [
+      "und", "oder", "für", "zur", "zum", "der", "ein", "eine", "einer", "eines", "einem",
+      "einen", "sind", "wird", "werden", "haben", "nach", "auf", "auch", "noch", "aber", "wenn",
+      "dass", "wir", "sie", "uns", "ihr", "ihm", "ihn", "deutschland", "schweiz", "wien",
+      "munchen", "koln",
+    ],
+    stems: [
+      "leiter", "mitarbeiter", "bearbeiter", "kaufmann", "kauffrau", "kaufmännisch",
+      "werkstudent", "praktikant", "assistent", "berater", "betreuer", "entwickler", "ingenieur",
+      "projekt", "geschäftsführ", "vertrieb", "finanzen", "buchhaltung", "steuer", "verwaltung",
+      "bereich", "stelle", "aufgabe", "gesucht", "vollzeit", "teilzeit", "homeoffice",
+      "fachkraft",
+    ],
+    letters: "äöüß",
+  },
+  {
+    lang: "pt",
+    words: ["uma", "vaga", "vagas", "somos", "buscamos", "lisboa", "brasil"],
+    stems: ["desenvolvedor", "engenheiro", "estagi"],
+    letters: "ãõ",
+  },
+  {
+    lang: "fr",
+    words: ["pour", "avec", "une", "dans", "nous", "vous", "bruxelles", "suisse"],
+    stems: [
+      "developpeur", "développeur", "ingénieur", "stagiaire", "alternan", "emploi", "responsable",
+      "vendeur", "conseiller", "technicien",
+    ],
+    letters: "èêëœ",
+  },
+  {
+    lang: "it",
+    words: ["siamo", "cerchiamo", "azienda", "italia", "roma", "milano", "torino"],
+    stems: [
+      "sviluppatore", "programmatore", "ingegnere", "impiegat", "tirocinio", "lavoro",
+      "responsabile",
+    ],
+    letters: "",
+  },
+  {
+    lang: "nl",
+    words: ["voor", "het", "een", "wij", "zoeken"],
+    stems: ["ontwikkelaar", "medewerker", "beheerder", "vacature", "adviseur"],
+    letters: "",
+  },
+  {
+    lang: "es",
+    words: ["una", "empresa", "espana"],
+    stems: [
+      "desarrollador", "programador", "ingenier", "analista", "gerente", "vendedor", "empleo",
+      "trabajo", "puesto", "tecnico", "técnico", "asesor", "contador", "jefe",
+    ],
+    letters: "ñ¿¡",
+  },
+  { lang: "pl", words: ["polska", "warszawa"], stems: [], letters: "łęąśźż" },
+  { lang: "cs", words: ["praha", "cesko"], stems: [], letters: "řěů" },
+];
+
+function hintPattern(words, stems, letters = "") {
+  const parts = words.length ? [`\\b(?:${words.join("|")})\\b`] : [];
+  if (stems.length) parts.push(`(?:${stems.join("|")})`);
+  if (letters) parts.push(`[${letters}]`);
+  return new RegExp(parts.join("|"), "i");
+}
+
+// Per language: function words, counted, and the stronger stem/letter evidence.
+const LANGUAGE_HINTS = LANGUAGES.map(({ lang, words, stems, letters }) => ({
+  lang,
+  words: new RegExp(`\\b(?:${words.join("|")})\\b`, "gi"),
+  strong: stems.length || letters ? hintPattern([], stems, letters) : null,
+}));
+
+/** German words or stems: text matching this is likely German. */
+export const GERMAN_HINT = hintPattern(LANGUAGES[0].words, LANGUAGES[0].stems);
+
+/** Words or stems of any of the languages above: text matching this is likely not English. */
+export const NON_ENGLISH_HINT = hintPattern(
+  LANGUAGES.flatMap(({ words }) => words),
+  LANGUAGES.flatMap(({ stems }) => stems),
+);
+
+/**
+ * Language code ("de", "fr", ...) the text is written in, or undefined without strong evidence:
+ * a job-title stem, a distinctive letter, or at least two function words of the same language.
+ * A single short word ("Wien", "une") is not enough, since it also turns up in English text.
+ */
+export function hintedLanguage(text) {
+  return LANGUAGE_HINTS.find(
+    ({ words, strong }) => strong?.test(text) || (text.match(words) ?? []).length >= 2,
+  )?.lang;
+}
@@ -3,75 +3,240 @@
  * Uses MyMemory API (free, no key). Only translates when text appears non-English.
  */
 
+import { hintedLanguage, NON_ENGLISH_HINT } from "./language-hints.mjs";
+
 const MYMEMORY_URL = "https://api.mymemory.translated.net/get";
 const MAX_CHARS_PER_REQUEST = 400; // API limit ~500 bytes
 const REQUEST_DELAY_MS = 200; // Avoid rate limits
-const LONG_TEXT_MAX_CHARS = 2200;
+const MAX_CONCURRENT_REQUESTS = 3; // MyMemory requests in flight across all callers
+const LONG_TEXT_CONCURRENCY = 2; // Chunks of one description translated at the same time
+// Packs short fields into one request; punctuation-only so it passes through translation.
+const FIELD_SEPARATOR = " ||| ";
+const FIELD_SEPARATOR_PATTERN = /\s*\|\|\|\s*/;
+
+const TRANSLATION_CACHE_MAX_ENTRIES = 5000;
+
+// Company names, locations and titles repeat across jobs; remember their translations.
+const translationCache = new Map<string, string>();
 
 function delay(ms: number): Promise<void> {
   return new Promise((resolve) => setTimeout(resolve, ms));
 }
 
-/** True if the character is in a non-Latin script (Arabic, Cyrillic, CJK, etc.). */
-function hasNonLatinScript(text: string): boolean {
+/** Map items through fn with at most `limit` calls in flight, preserving input order. */
+async function mapWithConcurrency<T, R>(
+  items: T[],
+  limit: number,
+  fn: (item: T) => Promise<R>,
+): Promise<R[]> {
+  const results = new Array<R>(items.length);
+  let next = 0;
+  const worker = async () => {
+    while (next < items.length) {
+      const index = next++;
+      results[index] = await fn(items[index]);
+    }
+  };
+  await Promise.all(Array.from({ length: Math.min(limit, items.length) }, worker));
+  return results;
+}
+
+// Every MyMemory call takes one of MAX_CONCURRENT_REQUESTS slots and gives it back
+// REQUEST_DELAY_MS after its response, however many jobs, groups or chunks are being translated.
+let activeRequests = 0;
+const waitingRequests: (() => void)[] = [];
+
+async function acquireRequestSlot(): Promise<void> {
+  if (activeRequests < MAX_CONCURRENT_REQUESTS) {
+    activeRequests++;
+    return;
+  }
+  // The releasing request hands its slot straight to the next waiter.
+  await new Promise<void>((resolve) => waitingRequests.push(resolve));
+}
+
+function releaseRequestSlot(): void {
+  const next = waitingRequests.shift();
+  if (next) next();
+  else activeRequests--;
+}
+
+function getCachedTranslation(text: string): string | undefined {
+  const cached = translationCache.get(text);
+  if (cached !== undefined) {
+    // Re-insert so the Map's insertion order doubles as least-recently-used order.
+    translationCache.delete(text);
+    translationCache.set(text, cached);
+  }
+  return cached;
+}
+
+function setCachedTranslation(text: string, translated: string): void {
+  translationCache.set(text, translated);
+  if (translationCache.size > TRANSLATION_CACHE_MAX_ENTRIES) {
+    const oldest = translationCache.keys().next().value;
+    if (oldest !== undefined) translationCache.delete(oldest);
+  }
+}
+
+// Non-Latin scripts that always need translation (Arabic, Cyrillic, CJK, etc.).
+const NON_LATIN_SCRIPTS: [number, number, string][] = [
+  [0x0600, 0x06ff, "arabic"],
+  [0x0750, 0x077f, "arabic"], // Arabic Supplement
+  [0x0400, 0x04ff, "cyrillic"],
+  [0x4e00, 0x9fff, "cjk"], // CJK Unified Ideographs
+  [0x0590, 0x05ff, "hebrew"],
+  [0x0e00, 0x0e7f, "thai"],
+];
+
+/** Name of the non-Latin script the code point belongs to, or undefined for Latin/other. */
+function nonLatinScriptOf(code: number): string | undefined {
+  for (const [start, end, script] of NON_LATIN_SCRIPTS) {
+    if (code >= start && code <= end) return script;
+  }
+  return undefined;
+}
+
+/** True if the code point is in a non-Latin script (Arabic, Cyrillic, CJK, etc.). */
+function isNonLatinCodePoint(code: number): boolean {
+  return nonLatinScriptOf(code) !== undefined;
+}
+
+/** First non-Latin script found in the text, or undefined when there is none. */
+function nonLatinScriptOfText(text: string): string | undefined {
   for (const c of text) {
     const code = c.codePointAt(0)!;
-    // Arabic, Cyrillic, CJK, Hebrew, Thai, etc.
-    if (code >= 0x0600 && code <= 0x06ff) return true; // Arabic
-    if (code >= 0x0750 && code <= 0x077f) return true; // Arabic Supplement
-    if (code >= 0x0400 && code <= 0x04ff) return true; // Cyrillic
-    if (code >= 0x4e00 && code <= 0x9fff) return true; // CJK Unified Ideographs
-    if (code >= 0x0590 && code <= 0x05ff) return true; // Hebrew
-    if (code >= 0x0e00 && code <= 0x0e7f) return true; // Thai
+    if (code <= 127) continue;
+    const script = nonLatinScriptOf(code);
+    if (script) return script;
   }
-  return false;
+  return undefined;
 }
 
 /** Heuristic: text is likely already English (skip translation to save quota). */
 export function isLikelyEnglish(text: string): boolean {
   if (!text || text.length < 2) return true;
   const t = text.trim();
-  // Any non-Latin script (e.g. Arabic "لوسيديا") → always translate
-  if (hasNonLatinScript(t)) return false;
+  // One pass over the code points: any non-Latin script (e.g. Arabic "لوسيديا") → always
+  // translate; otherwise count non-ASCII characters without building an array.
+  let nonAscii = 0;
+  for (const c of t) {
+    const code = c.codePointAt(0)!;
+    if (code <= 127) continue;
+    if (isNonLatinCodePoint(code)) return false;
+    nonAscii++;
+  }
   // High ratio of non-ASCII or common diacritics
-  const nonAscii = [...t].filter((c) => c.codePointAt(0)! > 127).length;
   if (nonAscii > t.length * 0.15) return false;
   if (/[äöüßàáâãäåèéêëìíîïòóôõùúûüýÿñç]/i.test(t)) return false;
   return true;
 }
 
 /**
- * Translate a single string to English. Returns original on failure or if empty.
- * Truncates to MAX_CHARS_PER_REQUEST to respect API limits.
+ * Plain-ASCII text without non-English words or job-title stems (see language-hints.mjs) is
+ * English; no need to call the API.
  */
-export async function translateToEnglish(text: string, force = false): Promise<string> {
-  const trimmed = text.trim();
-  if (!trimmed) return trimmed;
+function isPlainEnglishAscii(text: string): boolean {
+  return /^[\t\n\r -~]*$/.test(text) && !NON_ENGLISH_HINT.test(text);
+}
+
+// Fragments of MyMemory error and quota messages that come back in place of a translation.
+const BAD_TRANSLATION_MARKERS = [
+  "invalid source language",
+  "invalid target language",
+  "invalid langpair",
+  "example: langpair",
+  "mymemory warning",
+];
+
+function isBadTranslation(text: string): boolean {
+  const normalized = text.toLowerCase().replace(/\s+/g, " ");
+  return BAD_TRANSLATION_MARKERS.some((marker) => normalized.includes(marker));
+}
+
+/** Text actually sent to the API for a trimmed string: at most MAX_CHARS_PER_REQUEST. */
+function requestText(trimmed: string): string {
+  return trimmed.length > MAX_CHARS_PER_REQUEST ? trimmed.slice(0, MAX_CHARS_PER_REQUEST) : trimmed;
+}
+
+const URL_OR_EMAIL = /^(?:https?:\/\/|www\.)\S+$|^[^\s@]+@[^\s@]+\.[^\s@]+$/i;
+
+/**
+ * Cheap check for text worth sending: URLs, e-mail addresses and strings that are mostly digits
+ * or symbols (salary ranges, IDs) come back unchanged or garbled, so keep them as written.
+ */
+function isTranslatable(text: string): boolean {
+  if (URL_OR_EMAIL.test(text)) return false;
+  let letters = 0;
+  let length = 0;
+  for (const c of text) {
+    length++;
+    // Non-ASCII characters are counted as letters: accented Latin, Arabic, CJK, etc.
+    if (/[A-Za-z]/.test(c) || c.codePointAt(0)! > 127) letters++;
+  }
+  return letters >= 2 && letters / length > 0.3;
+}
+
+/**
+ * Result of translateToEnglish when it can be had without a request (empty, already English, or
+ * cached); undefined when the API has to be called.
+ */
+function translateWithoutRequest(trimmed: string, force: boolean): string | undefined {
+  if (!trimmed || isPlainEnglishAscii(trimmed) || !isTranslatable(trimmed)) return trimmed;
   if (!force && isLikelyEnglish(trimmed)) return trimmed;
-  const toTranslate = trimmed.length > MAX_CHARS_PER_REQUEST
-    ? trimmed.slice(0, MAX_CHARS_PER_REQUEST)
-    : trimmed;
+  return getCachedTranslation(requestText(trimmed));
+}
+
+function rememberTranslation(text: string, translated: string): void {
+  setCachedTranslation(text, translated);
+  // When the output looks English, remember it as such so translating an already translated
+  // field again (e.g. one with typographic quotes or dashes) is a cache hit. MyMemory can answer
+  // with the source text or another language, so other outputs are not cached as final.
+  if (translated !== text && (isPlainEnglishAscii(translated) || isLikelyEnglish(translated))) {
+    setCachedTranslation(translated, translated);
+  }
+}
+
+/** Send one request to MyMemory; undefined on any failure or error message. Not cached. */
+async function requestTranslation(text: string): Promise<string | undefined> {
+  await acquireRequestSlot();
   try {
     const url = new URL(MYMEMORY_URL);
-    url.searchParams.set("q", toTranslate);
+    url.searchParams.set("q", text);
     url.searchParams.set("langpair", "auto|en");
     const res = await fetch(url.toString(), { signal: AbortSignal.timeout(8000) });
-    if (!res.ok) return trimmed;
+    if (!res.ok) return undefined;
     const data = (await res.json()) as {
       responseData?: { translatedText?: string };
       response?: { translatedText?: string };
       quotaFinished?: boolean;
     };
-    if (data.quotaFinished) return trimmed;
+    if (data.quotaFinished) return undefined;
     const translated =
       data.responseData?.translatedText?.trim() ?? data.response?.translatedText?.trim();
-    if (translated) return translated;
-    return trimmed;
+    return translated && !isBadTranslation(translated) ? translated : undefined;
   } catch {
-    return trimmed;
+    return undefined;
+  } finally {
+    delay(REQUEST_DELAY_MS).then(releaseRequestSlot);
   }
 }
 
+/**
+ * Translate a single string to English. Returns original on failure or if empty.
+ * Truncates to MAX_CHARS_PER_REQUEST to respect API limits.
+ */
+export async function translateToEnglish(text: string, force = false): Promise<string> {
+  const trimmed = text.trim();
+  const known = translateWithoutRequest(trimmed, force);
+  if (known !== undefined) return known;
+  const toTranslate = requestText(trimmed);
+  const translated = await requestTranslation(toTranslate);
+  if (translated === undefined) return trimmed;
+  rememberTranslation(toTranslate, translated);
+  return translated;
+}
+
 function splitTextForTranslation(text: string, maxChars = MAX_CHARS_PER_REQUEST): string[] {
   const normalized = text.replace(/\s+/g, " ").trim();
   if (!normalized) return [];
@@ -109,28 +274,81 @@ function splitTextForTranslation(text: string, maxChars = MAX_CHARS_PER_REQUEST)
   return chunks;
 }
 
-/** Translate longer text by chunking while preserving order. */
-export async function translateLongToEnglish(
-  text: string,
-  maxChars = LONG_TEXT_MAX_CHARS,
-  force = false,
-): Promise<string> {
+/**
+ * Translate longer text by chunking while preserving order. Every chunk is translated so stored
+ * descriptions are fully English; quota is bounded by how many jobs a caller processes.
+ */
+export async function translateLongToEnglish(text: string, force = false): Promise<string> {
   const trimmed = text.trim();
-  if (!trimmed) return trimmed;
+  if (!trimmed || isPlainEnglishAscii(trimmed)) return trimmed;
   if (!force && isLikelyEnglish(trimmed)) return trimmed;
 
-  const source = trimmed.slice(0, maxChars);
-  const chunks = splitTextForTranslation(source);
+  const chunks = splitTextForTranslation(trimmed);
   if (chunks.length === 0) return trimmed;
 
-  const translatedChunks: string[] = [];
-  for (let i = 0; i < chunks.length; i++) {
-    const translated = await translateToEnglish(chunks[i], force);
-    translatedChunks.push(translated);
-    if (i < chunks.length - 1) await delay(REQUEST_DELAY_MS);
+  const translatedChunks = await mapWithConcurrency(chunks, LONG_TEXT_CONCURRENCY, (chunk) =>
+    translateToEnglish(chunk, force),
+  );
+
+  return translatedChunks.join(" ");
+}
+
+/**
+ * Translate several short strings with a single request by joining them with a separator.
+ * Falls back to one request per string if the separator does not survive translation. Each
+ * result is cached under its own value, never under the joined text, so a value repeated in a
+ * later batch is a cache hit whatever it is packed with.
+ */
+async function translateFieldsToEnglish(values: string[], force = false): Promise<string[]> {
+  const joined = values.join(FIELD_SEPARATOR);
+  if (values.length > 1 && joined.length <= MAX_CHARS_PER_REQUEST) {
+    const parts = (await requestTranslation(joined))
+      ?.split(FIELD_SEPARATOR_PATTERN)
+      .map((part) => part.trim());
+    if (parts && parts.length === values.length && parts.every(Boolean)) {
+      values.forEach((value, i) => rememberTranslation(value, parts[i]));
+      return parts;
+    }
+  }
+
+  // Request spacing comes from the shared request slots; cache hits go straight through.
+  const translated: string[] = [];
+  for (const value of values) {
+    translated.push(await translateToEnglish(value, force));
   }
+  return translated;
+}
 
-  return translatedChunks.join(" ").replace(/\s+/g, " ").trim();
+// English place-name tokens that show up in job locations. A location made only of these (or of
+// short uppercase codes such as "BR" or "USA") is already English and is kept as written. Local
+// names such as "München" or "Deutschland" are left out so they still get translated.
+const KNOWN_LOCATION_TOKENS = new Set([
+  "remote", "hybrid", "onsite", "on-site", "worldwide", "anywhere", "global",
+  "greater", "area", "metropolitan", "region",
+  "europe", "emea", "apac", "latam", "americas", "asia", "africa",
+  "united", "states", "kingdom", "arab", "emirates", "saudi", "arabia", "czech", "republic",
+  "germany", "france", "spain", "italy", "portugal", "netherlands", "belgium", "austria",
+  "switzerland", "poland", "sweden", "norway", "denmark", "finland", "ireland", "romania",
+  "hungary", "greece", "turkey", "israel", "brazil", "mexico", "argentina", "chile", "colombia",
+  "peru", "canada", "india", "china", "japan", "singapore", "australia",
+  "berlin", "munich", "hamburg", "frankfurt", "cologne", "düsseldorf", "stuttgart", "paris",
+  "lyon", "madrid", "barcelona", "lisbon", "porto", "milan", "rome", "amsterdam", "rotterdam",
+  "brussels", "vienna", "zurich", "geneva", "warsaw", "krakow", "prague", "budapest",
+  "bucharest", "istanbul", "stockholm", "oslo", "copenhagen", "helsinki", "dublin", "london",
+  "são", "paulo", "rio", "janeiro", "bogotá", "bogota", "lima", "santiago", "buenos", "aires",
+  "new", "york", "san", "francisco", "toronto", "bengaluru", "bangalore", "mumbai", "delhi",
+  "hyderabad", "pune", "chennai", "tokyo", "sydney", "dubai", "tel", "aviv",
+]);
+const LOCATION_TOKEN_SEPARATOR = /[\s,/()|]+/;
+
+function isKnownLocation(location: string): boolean {
+  const tokens = location.split(LOCATION_TOKEN_SEPARATOR).filter(Boolean);
+  return (
+    tokens.length > 0 &&
+    tokens.every(
+      (token) => /^[A-Z]{2,3}$/.test(token) || KNOWN_LOCATION_TOKENS.has(token.toLowerCase()),
+    )
+  );
 }
 
 export interface JobTextFields {
@@ -140,38 +358,111 @@ export interface JobTextFields {
   description?: string | null;
 }
 
+const CONCURRENCY = 3;
+
+/** Group short strings so each group, joined with FIELD_SEPARATOR, fits in one request. */
+function packForRequests(values: string[]): string[][] {
+  const groups: string[][] = [];
+  let current: string[] = [];
+  let length = 0;
+  for (const value of values) {
+    const nextLength = current.length
+      ? length + FIELD_SEPARATOR.length + value.length
+      : value.length;
+    if (current.length && nextLength > MAX_CHARS_PER_REQUEST) {
+      groups.push(current);
+      current = [value];
+      length = value.length;
+      continue;
+    }
+    current.push(value);
+    length = nextLength;
+  }
+  if (current.length) groups.push(current);
+  return groups;
+}
+
 /**
  * Translate title, company, location, and description to English when they appear non-English.
- * Runs translations with a short delay between calls to avoid rate limits.
  */
 export async function ensureJobEnglish<T extends JobTextFields>(job: T): Promise<T> {
-  const title = await translateToEnglish(job.title, true);
-  await delay(REQUEST_DELAY_MS);
-  const company = await translateToEnglish(job.company, true);
-  await delay(REQUEST_DELAY_MS);
-  const location = job.location
-    ? await translateToEnglish(String(job.location), true)
-    : (job.location ?? "");
-  await delay(REQUEST_DELAY_MS);
-  const description =
-    job.description && String(job.description).trim()
-      ? await translateLongToEnglish(String(job.description), LONG_TEXT_MAX_CHARS, true)
-      : job.description;
-
-  return { ...job, title, company, location, description };
+  const [translated] = await ensureJobsEnglish([job]);
+  return translated;
 }
 
-const CONCURRENCY = 3;
-
 /**
- * Translate an array of jobs to English. Processes CONCURRENCY jobs at a time to balance speed and rate limits.
+ * Translate an array of jobs to English, field by field rather than job by job: every distinct
+ * title, company, location, and description is translated once and the results are mapped back,
+ * so values repeated across the batch cost a single lookup. Short values are packed into shared
+ * requests; MAX_CONCURRENT_REQUESTS caps how many reach MyMemory at once.
  */
 export async function ensureJobsEnglish<T extends JobTextFields>(jobs: T[]): Promise<T[]> {
-  const out: T[] = [];
-  for (let i = 0; i < jobs.length; i += CONCURRENCY) {
-    const batch = jobs.slice(i, i + CONCURRENCY);
-    const translated = await Promise.all(batch.map((j) => ensureJobEnglish(j)));
-    out.push(...translated);
+  const shortValues = new Set<string>();
+  const descriptions = new Set<string>();
+  for (const job of jobs) {
+    // One scan over all of a job's text: most scraped jobs are plain English ASCII and need no
+    // per-field checks at all.
+    const text = [job.title, job.company, job.location ?? "", job.description ?? ""].join("\n");
+    if (isPlainEnglishAscii(text)) continue;
+    shortValues.add(job.title.trim());
+    shortValues.add(job.company.trim());
+    const location = job.location ? String(job.location).trim() : "";
+    // Place names are proper nouns; only send locations that are not made of known places.
+    if (location && !isKnownLocation(location)) shortValues.add(location);
+    if (job.description && String(job.description).trim()) {
+      descriptions.add(String(job.description));
+    }
   }
-  return out;
+
+  // Values answered from the cache (or already English) are settled here; only misses are packed.
+  // The API detects one source language per request, so values are packed only with others of
+  // the same non-Latin script or clearly hinted language. Latin-script values without strong
+  // evidence are sent on their own rather than risk being read as another value's language.
+  const shortMap = new Map<string, string>();
+  const byLanguage = new Map<string, string[]>();
+  const groups: string[][] = [];
+  for (const value of shortValues) {
+    const known = translateWithoutRequest(value, true);
+    if (known !== undefined) {
+      shortMap.set(value, known);
+      continue;
+    }
+    const language = nonLatinScriptOfText(value) ?? hintedLanguage(value);
+    if (!language) {
+      groups.push([value]);
+      continue;
+    }
+    const values = byLanguage.get(language);
+    if (values) values.push(value);
+    else byLanguage.set(language, [value]);
+  }
+  for (const values of byLanguage.values()) groups.push(...packForRequests(values));
+  const uniqueDescriptions = [...descriptions];
+  const [translatedGroups, translatedDescriptions] = await Promise.all([
+    mapWithConcurrency(groups, CONCURRENCY, (group) => translateFieldsToEnglish(group, true)),
+    mapWithConcurrency(uniqueDescriptions, CONCURRENCY, (description) =>
+      translateLongToEnglish(description, true),
+    ),
+  ]);
+
+  groups.forEach((group, i) => {
+    group.forEach((value, j) => shortMap.set(value, translatedGroups[i][j]));
+  });
+  const descriptionMap = new Map<string, string>();
+  uniqueDescriptions.forEach((value, i) => descriptionMap.set(value, translatedDescriptions[i]));
+  const lookup = (value: string) => {
+    const trimmed = value.trim();
+    return shortMap.get(trimmed) ?? trimmed;
+  };
+
+  return jobs.map((job) => ({
+    ...job,
+    title: lookup(job.title),
+    company: lookup(job.company),
+    location: job.location ? lookup(String(job.location)) : (job.location ?? ""),
+    description:
+      job.description && String(job.description).trim()
+        ? (descriptionMap.get(String(job.description)) ?? String(job.description).trim())
+        : job.description,
+  }));
 }
@@ -5,9 +5,11 @@
  */
 
 import { createClient } from "@supabase/supabase-js";
-import { readFileSync } from "fs";
+import { createHash } from "crypto";
+import { readFileSync, writeFileSync } from "fs";
 import { join, dirname } from "path";
 import { fileURLToPath } from "url";
+import { GERMAN_HINT } from "../lib/language-hints.mjs";
 
 // ── Load .env.local ──────────────────────────────────────────────
 const __dirname = dirname(fileURLToPath(import.meta.url));
@@ -31,8 +33,18 @@ const DELAY = 400; // ms between API calls
 
 const sleep = (ms) => new Promise((r) => setTimeout(r, ms));
 
-// German common words used in job titles
-const GERMAN_WORDS = /\b(und|oder|für|mit|von|zur|zum|der|die|das|des|dem|den|ein|eine|einer|eines|einem|einen|ist|sind|wird|werden|werden|haben|hat|bei|nach|aus|auf|an|als|auch|noch|aber|wenn|dass|wir|sie|ich|er|ihr|uns|ihm|ihn|ihm|leiter|mitarbeiter|fach|kaufmann|kauffrau|kaufmännisch|werkstudent|praktikant|assistent|berater|betreuer|manager|entwickler|projektmanager|teamleiter|abteilungsleiter|geschäftsführer|vertrieb|finanzen|buchhaltung|steuer|recht|marketing|verwaltung|bereich|stelle|aufgabe|position|gesucht|vollzeit|teilzeit|homeoffice|remote)\b/i;
+// Results persist between runs, so re-running after a quota stop skips text already seen.
+const CACHE_PATH = join(__dirname, "..", ".translate-cache.json");
+let cache = {};
+try {
+    cache = JSON.parse(readFileSync(CACHE_PATH, "utf8"));
+} catch {
+    cache = {};
+}
+const cacheKey = (langpair, text) => createHash("sha1").update(`${langpair}\n${text}`).digest("hex");
+function saveCache() {
+    writeFileSync(CACHE_PATH, JSON.stringify(cache));
+}
 
 // Diacritics specific to European languages
 const DIACRITICS = /[äöüßàáâãåèéêëìíîïòóôõùúûüýÿñçğşøœæ]/i;
@@ -42,8 +54,8 @@ function needsTranslation(text) {
     const t = text.trim();
     // Has diacritics
     if (DIACRITICS.test(t)) return true;
-    // Has common German words
-    if (GERMAN_WORDS.test(t)) return true;
+    // Has common German words or job-title stems
+    if (GERMAN_HINT.test(t)) return true;
     // Non-Latin characters (Arabic, Cyrillic, etc.)
     for (const c of t) {
         const code = c.codePointAt(0);
@@ -56,18 +68,21 @@ function needsTranslation(text) {
 // Detect likely German text
 function detectLang(text) {
     if (!text) return "auto";
-    if (DIACRITICS.test(text) || GERMAN_WORDS.test(text)) return "de";
+    if (DIACRITICS.test(text) || GERMAN_HINT.test(text)) return "de";
     return "auto";
 }
 
+// Lowercase fragments of MyMemory error messages; plain substring checks, no regex engine.
 const JUNK = [
-    /auto.*invalid.*source/i,
-    /invalid.*langpair/i,
-    /example:.*langpair/i,
-    /please.*provide/i,
+    "invalid source language",
+    "invalid langpair",
+    "example: langpair",
+    "please provide",
 ];
 function isJunk(t) {
-    return !t || JUNK.some((p) => p.test(t));
+    if (!t) return true;
+    const lower = t.toLowerCase().replace(/\s+/g, " ");
+    return JUNK.some((p) => lower.includes(p));
 }
 
 async function translate(text, forceLang) {
@@ -76,6 +91,8 @@ async function translate(text, forceLang) {
 
     const lang = forceLang || detectLang(trimmed);
     const langpair = lang === "auto" ? "auto|en" : `${lang}|en`;
+    const key = cacheKey(langpair, trimmed);
+    if (key in cache) return cache[key] ?? text;
 
     try {
         const url = new URL(MYMEMORY);
@@ -87,10 +104,16 @@ async function translate(text, forceLang) {
         if (data.quotaFinished) return "___QUOTA___";
         const t = data.responseData?.translatedText?.trim();
         if (isJunk(t)) return text; // keep original
-        if (!t || t === trimmed) return text; // no change
+        if (!t || t === trimmed) {
+            cache[key] = null; // no change
+            return text;
+        }
+        cache[key] = t;
         return t;
     } catch {
         return text;
+    } finally {
+        await sleep(DELAY); // only network calls count against the rate limit
     }
 }
 
@@ -137,7 +160,6 @@ while (offset < total && !quota) {
         for (const { key, val } of fields) {
             if (!needsTranslation(val)) continue;
             const t = await translate(val);
-            await sleep(DELAY);
             if (t === "___QUOTA___") { quota = true; break; }
             if (t && t !== val && !isJunk(t)) {
                 updates[key] = t;
@@ -165,11 +187,13 @@ while (offset < total && !quota) {
         totalProcessed++;
     }
 
+    saveCache();
     offset += jobs.length;
     const pct = Math.round((Math.min(offset, total) / total) * 100);
     console.log(`  ↳ ${Math.min(offset, total)}/${total} (${pct}%) scanned, ${totalUpdated} updated\n`);
 }
 
+saveCache();
 if (quota) {
     console.log("\n⚠  MyMemory free quota exhausted. Run again tomorrow to continue.");
 } else {